@@ -1,7 +1,8 @@
 import asyncio
 import ssl
-from typing import Optional, Dict, AsyncContextManager
+from typing import Optional, Dict, AsyncContextManager, Union
 
+from async_timeout import timeout
 from aioquic.quic.configuration import QuicConfiguration
 from aioquic.asyncio.client import connect
 from aioquic.h3.connection import H3_ALPN
@@ -17,36 +18,56 @@ logger = get_logger(__name__)
 
 USER_AGENT = "moqt-client/0.1.0"
 
+# WebTransport CONNECT headers, split around the per-client :authority
+_CONNECT_PSEUDO_HEADERS = [
+    (b":method", b"CONNECT"),
+    (b":protocol", b"webtransport"),
+    (b":scheme", b"https"),
+]
+_CONNECT_HEADERS = [
+    (b":path", b"/moq"),
+    (b"sec-webtransport-http3-draft", b"draft02"),
+    (b"user-agent", USER_AGENT.encode()),
+]
+
 
 class MOQTClientProtocol(MOQTProtocol):
     """MOQT client implementation."""
 
+    # CLIENT_SETUP is identical for every connection, encode it once
+    _CLIENT_SETUP_WIRE = ClientSetup(
+        versions=[0xff000007],
+        parameters={}
+    ).serialize()
+
     def __init__(self, *args, client: 'MOQTClient', **kwargs):
         super().__init__(*args)
         self._client = client
 
-        # Register handler using closure to capture self
-        async def handle_server_setup(msg: MOQTMessage) -> None:
-            assert isinstance(msg, ServerSetup)
-            logger.info(f"Received ServerSetup: {msg}")
-
-            if self._moqt_session.is_set():
-                error = "Received duplicate SERVER_SETUP message"
-                logger.error(error)
-                self.close(
-                    error_code=SessionCloseCode.PROTOCOL_VIOLATION,
-                    reason_phrase=error
-                )
-                raise RuntimeError(error)
-            # indicate moqt session setup is complete
-            self._moqt_session.set()
-
-        # Register the closure as the handler
         self.message_handler.register_handler(
             MessageTypes.SERVER_SETUP,
-            handle_server_setup
+            self._handle_server_setup
         )
 
+    async def _handle_server_setup(self, msg: MOQTMessage) -> None:
+        """Handle SERVER_SETUP message."""
+        assert isinstance(msg, ServerSetup)
+        logger.info(f"Received ServerSetup: {msg}")
+
+        if self._moqt_session.cancelled():
+            logger.warning("Ignoring SERVER_SETUP received after setup timeout")
+            return
+        if self._moqt_session.done():
+            error = "Received duplicate SERVER_SETUP message"
+            logger.error(error)
+            self.close(
+                error_code=SessionCloseCode.PROTOCOL_VIOLATION,
+                reason_phrase=error
+            )
+            raise RuntimeError(error)
+        # indicate moqt session setup is complete
+        self._moqt_session.set_result(msg)
+
     async def initialize(self) -> None:
         """Initialize WebTransport and MOQT session."""
         # Create WebTransport session
@@ -54,25 +75,16 @@ class MOQTClientProtocol(MOQTProtocol):
             is_unidirectional=False
         )
 
-        headers = [
-            (b":method", b"CONNECT"),
-            (b":protocol", b"webtransport"),
-            (b":scheme", b"https"),
-            (b":authority",
-             f"{self._client.host}:{self._client.port}".encode()),
-            (b":path", b"/moq"),
-            (b"sec-webtransport-http3-draft", b"draft02"),
-            (b"user-agent", USER_AGENT.encode()),
-        ]
-
         logger.info(
             f"Sending WebTransport session request (stream: {session_stream_id})")
         self._h3.send_headers(stream_id=session_stream_id,
-                              headers=headers, end_stream=False)
+                              headers=self._client.connect_headers,
+                              end_stream=False)
 
         # Wait for WebTransport session establishment
         try:
-            await asyncio.wait_for(self._wt_session.wait(), timeout=30.0)
+            async with timeout(30.0):
+                await self._wt_session.wait()
         except asyncio.TimeoutError:
             logger.error("WebTransport session establishment timeout")
             raise
@@ -85,15 +97,11 @@ class MOQTClientProtocol(MOQTProtocol):
 
         # Send CLIENT_SETUP
         logger.info("Sending CLIENT_SETUP")
-        await self.send_control_message(
-            ClientSetup(
-                versions=[0xff000007],
-                parameters={}
-            ).serialize()
-        )
+        await self.send_control_message(self._CLIENT_SETUP_WIRE)
         # Wait for SERVER_SETUP
         try:
-            await asyncio.wait_for(self._moqt_session.wait(), timeout=10)
+            async with timeout(10):
+                await self._moqt_session
             logger.info("MOQT session setup complete")
         except asyncio.TimeoutError:
             logger.error("MOQT session setup timeout")
@@ -101,8 +109,8 @@ class MOQTClientProtocol(MOQTProtocol):
 
     async def subscribe(
         self,
-        namespace: str,
-        track_name: str,
+        namespace: Union[str, bytes],
+        track_name: Union[str, bytes],
         subscribe_id: int = 1,
         track_alias: int = 1,
         priority: int = 128,
@@ -113,9 +121,16 @@ class MOQTClientProtocol(MOQTProtocol):
         end_group: Optional[int] = None,
         parameters: Optional[Dict[int, bytes]] = None
     ) -> None:
-        """Subscribe to a track with configurable options."""
-        logger.info(f"Subscribing to {namespace}/{track_name}")
-
+        """Subscribe to a track with configurable options.
+
+        namespace and track_name may be passed as UTF-8 encoded bytes to skip
+        re-encoding when subscribing repeatedly to the same names.
+        """
+        logger.info("Subscribing to %s/%s", namespace, track_name)
+        if isinstance(namespace, str):
+            namespace = namespace.encode()
+        if isinstance(track_name, str):
+            track_name = track_name.encode()
         if parameters is None:
             parameters = {}
 
@@ -123,8 +138,8 @@ class MOQTClientProtocol(MOQTProtocol):
             Subscribe(
                 subscribe_id=subscribe_id,
                 track_alias=track_alias,
-                namespace=namespace.encode(),
-                track_name=track_name.encode(),
+                namespace=namespace,
+                track_name=track_name,
                 priority=priority,
                 direction=group_order,
                 filter_type=filter_type,
@@ -147,6 +162,12 @@ class MOQTClient:  # New connection manager class
         self.host = host
         self.port = port
         self.debug = debug
+        # host/port are fixed per client, so build CONNECT headers once
+        self.connect_headers = (
+            _CONNECT_PSEUDO_HEADERS +
+            [(b":authority", f"{host}:{port}".encode())] +
+            _CONNECT_HEADERS
+        )
 
         if configuration is None:
             self.configuration = QuicConfiguration(
@@ -161,7 +182,12 @@ class MOQTClient:  # New connection manager class
         # logger.debug(f"quic_logger: {self.configuration.quic_logger.__class__}")
 
     def connect(self) -> AsyncContextManager[MOQTClientProtocol]:
-        """Return a context manager that creates MOQTClientProtocol instance."""
+        """Return a context manager that creates MOQTClientProtocol instance.
+
+        The connection runs on the current asyncio event loop. To use uvloop,
+        start that loop with uvloop at the program entry point, e.g.
+        uvloop.run(main()) instead of asyncio.run(main()).
+        """
         return connect(
             self.host,
             self.port,
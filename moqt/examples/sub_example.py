@@ -25,6 +25,8 @@ def parse_args():
                         help='How long to run before unsubscribing (seconds)')
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug output')
+    parser.add_argument('--uvloop', action='store_true',
+                        help='Run on the uvloop event loop (requires uvloop)')
     return parser.parse_args()
 
 
@@ -52,7 +54,12 @@ async def main(host: str, port: int, namespace: str, trackname: str, timeout: in
 
 if __name__ == "__main__":
     args = parse_args()
-    asyncio.run(main(
+    if args.uvloop:
+        import uvloop
+        run = uvloop.run
+    else:
+        run = asyncio.run
+    run(main(
         host=args.host,
         port=args.port,
         namespace=args.namespace,
@@ -8,10 +8,10 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MOQTMessage:
     """Base class for all MOQT messages."""
-    # type: Optional[int] = None
+    # type: ClassVar[int] is set by each message subclass
 
     def serialize(self) -> bytes:
         """Convert message to complete wire format."""
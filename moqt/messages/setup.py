@@ -1,40 +1,93 @@
+import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 from aioquic.buffer import Buffer
 from .base import MOQTMessage
 from ..moqtypes import MessageTypes, SetupParamType
 from ..utils.logger import get_logger
+from ..utils.varint import decode_varint, varint_len
 
 logger = get_logger(__name__)
 
 
-@dataclass
+# upper bound on the encoded message type and length varints
+_MAX_HEADER_LEN = 16
+
+
+def _params_len(parameters: Dict[int, bytes]) -> int:
+    """Return the encoded size of a setup parameter block."""
+    if not parameters:
+        return 1
+    size = varint_len(len(parameters))
+    for param_id, param_value in parameters.items():
+        value_len = len(param_value)
+        size += varint_len(param_id) + varint_len(value_len) + value_len
+    return size
+
+
+def _push_params(buf: Buffer, parameters: Dict[int, bytes]) -> None:
+    """Write a setup parameter block to buf."""
+    buf.push_uint_var(len(parameters))
+    for param_id, param_value in parameters.items():
+        buf.push_uint_var(param_id)
+        buf.push_uint_var(len(param_value))
+        buf.push_bytes(param_value)
+
+
+# setup param type -> (name, value decoder)
+_PARAM_HANDLERS = {
+    SetupParamType.MAX_SUBSCRIBER_ID: ("MAX_SUBSCRIBER_ID", decode_varint),
+    SetupParamType.CLIENT_ROLE: ("CLIENT_ROLE", None),
+    SetupParamType.ENDPOINT_PATH: ("ENDPOINT_PATH", None),
+}
+
+
+def _parse_setup_params(buffer: Buffer, count: int) -> Dict[int, Any]:
+    """Parse count setup parameters from buffer."""
+    params = {}
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for _ in range(count):
+        param_id = buffer.pull_uint_var()
+        param_len = buffer.pull_uint_var()
+        param_value = buffer.pull_bytes(param_len)
+        handler = _PARAM_HANDLERS.get(param_id)
+        if handler is None:
+            id = "UNKNOWN"
+            logger.error(
+                "SETUP: received unknown setup param type: %#x", param_id)
+        else:
+            id, decoder = handler
+            if decoder is not None:
+                param_value = decoder(param_value)
+        if debug:
+            logger.debug("  param: id: %s (%#x) len: %d val: %s",
+                         id, param_id, param_len, param_value)
+        params[param_id] = param_value
+    return params
+
+
+@dataclass(slots=True)
 class ServerSetup(MOQTMessage):
     """SERVER_SETUP message for accepting MOQT session."""
     selected_version: int = None
     parameters: Dict[int, bytes] = None
 
-    def __post_init__(self):
-        self.type = MessageTypes.SERVER_SETUP
+    type: ClassVar[int] = MessageTypes.SERVER_SETUP
 
     def serialize(self) -> bytes:
-        buf = Buffer(capacity=32)
-        payload = Buffer(capacity=32)
-
-        # Add selected version
-        payload.push_uint_var(self.selected_version)
+        # Calculate payload size
+        payload_size = varint_len(self.selected_version)
+        payload_size += _params_len(self.parameters)
 
-        # Add parameters
-        payload.push_uint_var(len(self.parameters))
-        for param_id, param_value in self.parameters.items():
-            payload.push_uint_var(param_id)
-            payload.push_uint_var(len(param_value))
-            payload.push_bytes(param_value)
+        buf = Buffer(capacity=_MAX_HEADER_LEN + payload_size)
 
-        # Build final message
+        # Write header
         buf.push_uint_var(self.type)  # SERVER_SETUP type
-        buf.push_uint_var(len(payload.data))
-        buf.push_bytes(payload.data)
+        buf.push_uint_var(payload_size)
+
+        # Write selected version and parameters
+        buf.push_uint_var(self.selected_version)
+        _push_params(buf, self.parameters)
         return buf.data
 
     @classmethod
@@ -43,66 +96,46 @@ class ServerSetup(MOQTMessage):
         version = buffer.pull_uint_var()
         param_count = buffer.pull_uint_var()
 
-        logger.info(
-            f"SERVER_SETUP: version: {hex(version)} params: {param_count} ")
-        params = {}
-        for _ in range(param_count):
-            param_id = buffer.pull_uint_var()
-            param_len = buffer.pull_uint_var()
-            param_value = buffer.pull_bytes(param_len)
-            if (param_id == SetupParamType.MAX_SUBSCRIBER_ID):
-                id = "MAX_SUBSCRIBER_ID"
-                param_value = Buffer(data=param_value).pull_uint_var()
-            elif (param_id == SetupParamType.CLIENT_ROLE):
-                id = "CLIENT_ROLE"
-            elif (param_id == SetupParamType.ENDPOINT_PATH):
-                id = "ENDPOINT_PATH"
-            else:
-                id = "UNKNOWN"
-                logger.error(
-                    f"_handle_server_setup: received unknown setup param type: {hex(param_id)}")
-            logger.debug(
-                f"  param: id: {id} ({hex(param_id)}) len: {param_len} val: {param_value}")
-            params[param_id] = param_value
+        logger.info("SERVER_SETUP: version: %#x params: %d",
+                    version, param_count)
+        params = _parse_setup_params(buffer, param_count)
         return cls(selected_version=version, parameters=params)
         # self.protocol._moqt_session.set()
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientSetup(MOQTMessage):
     """CLIENT_SETUP message for initializing MOQT session."""
     versions: List[int] = None
     parameters: Dict[int, bytes] = None
 
-    def __post_init__(self):
-        self.type = MessageTypes.CLIENT_SETUP
+    type: ClassVar[int] = MessageTypes.CLIENT_SETUP
 
     def serialize(self) -> bytes:
-        buf = Buffer(capacity=32)
-        payload = Buffer(capacity=32)
-
-        # Add versions
-        payload.push_uint_var(len(self.versions))
+        # Calculate payload size
+        payload_size = varint_len(len(self.versions))
         for version in self.versions:
-            payload.push_uint_var(version)
+            payload_size += varint_len(version)
+        payload_size += _params_len(self.parameters)
 
-        # Add parameters
-        payload.push_uint_var(len(self.parameters))
-        for param_id, param_value in self.parameters.items():
-            payload.push_uint_var(param_id)
-            payload.push_uint_var(len(param_value))
-            payload.push_bytes(param_value)
+        buf = Buffer(capacity=_MAX_HEADER_LEN + payload_size)
 
-        # Build final message
+        # Write header
         buf.push_uint_var(self.type)  # CLIENT_SETUP type
-        buf.push_uint_var(len(payload.data))
-        buf.push_bytes(payload.data)
+        buf.push_uint_var(payload_size)
+
+        # Write versions
+        buf.push_uint_var(len(self.versions))
+        for version in self.versions:
+            buf.push_uint_var(version)
+
+        # Write parameters
+        _push_params(buf, self.parameters)
         return buf.data
 
     @classmethod
-    def deserialize(cls, buffer: Buffer) -> None:
+    def deserialize(cls, buffer: Buffer) -> 'ClientSetup':
         """Handle CLIENT_SETUP message."""
-
         versions = []
         version_count = buffer.pull_uint_var()
         for _ in range(version_count):
@@ -110,29 +143,10 @@ class ClientSetup(MOQTMessage):
 
         param_count = buffer.pull_uint_var()
 
-        logger.info(
-            f"CLIENT_SETUP: version: {versions} params: {param_count} ")
-        params = {}
-        for _ in range(param_count):
-            param_id = buffer.pull_uint_var()
-            param_len = buffer.pull_uint_var()
-            param_value = buffer.pull_bytes(param_len)
-            if (param_id == SetupParamType.MAX_SUBSCRIBER_ID):
-                id = "MAX_SUBSCRIBER_ID"
-                param_value = Buffer(data=param_value).pull_uint_var()
-            elif (param_id == SetupParamType.CLIENT_ROLE):
-                id = "CLIENT_ROLE"
-            elif (param_id == SetupParamType.ENDPOINT_PATH):
-                id = "ENDPOINT_PATH"
-            else:
-                id = "UNKNOWN"
-                logger.error(
-                    f"_handle_server_setup: received unknown setup param type: {hex(param_id)}")
-            params[param_id] = param_value
-            logger.debug(
-                f"  param: id: {id} ({hex(param_id)}) len: {param_len} val: {param_value}")
-
-            return cls(versions=versions, parameters=params)
+        logger.info("CLIENT_SETUP: version: %s params: %d",
+                    versions, param_count)
+        params = _parse_setup_params(buffer, param_count)
+        return cls(versions=versions, parameters=params)
 
     def client_setup(self, version: int = 0xff000007) -> bytes:
         """Create a CLIENT_SETUP message."""
@@ -144,27 +158,27 @@ class ClientSetup(MOQTMessage):
         return msg.serialize()
 
 
-@dataclass
+@dataclass(slots=True)
 class GoAway(MOQTMessage):
     new_session_uri: str = None
 
-    def __post_init__(self):
-        self.type = MessageTypes.GOAWAY
+    type: ClassVar[int] = MessageTypes.GOAWAY
 
     def serialize(self) -> bytes:
-        buf = Buffer(capacity=32 + len(self.new_session_uri))
+        uri_bytes = self.new_session_uri.encode()
+        uri_len = len(uri_bytes)
 
         # Calculate payload size
-        payload_size = 1  # uri length varint
-        payload_size += len(self.new_session_uri.encode())  # uri bytes
+        payload_size = varint_len(uri_len) + uri_len
+
+        buf = Buffer(capacity=_MAX_HEADER_LEN + payload_size)
 
-        # Write message
+        # Write header
         buf.push_uint_var(self.type)
         buf.push_uint_var(payload_size)
 
         # Write URI length and data
-        uri_bytes = self.new_session_uri.encode()
-        buf.push_uint_var(len(uri_bytes))
+        buf.push_uint_var(uri_len)
         buf.push_bytes(uri_bytes)
 
         return buf.data
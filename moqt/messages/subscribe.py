@@ -1,11 +1,12 @@
 from ..moqtypes import MessageTypes, TrackStatusCode
 from typing import Dict, Optional
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional
 from aioquic.buffer import Buffer
 from .base import MOQTMessage
 
 from ..utils.logger import get_logger
+from ..utils.varint import varint_len
 
 logger = get_logger(__name__)
 
@@ -83,13 +84,12 @@ def _handle_subscribe_done(self, buffer: Buffer) -> None:
         f"Subscription {subscribe_id} done - Status {status_code}: {reason}")
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackStatusRequest(MOQTMessage):
     namespace: bytes = None  # Tuple encoded
     track_name: bytes = None
 
-    def __post_init__(self):
-        self.type = MessageTypes.TRACK_STATUS_REQUEST
+    type: ClassVar[int] = MessageTypes.TRACK_STATUS_REQUEST
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=32)
@@ -138,7 +138,7 @@ class TrackStatusRequest(MOQTMessage):
         return cls(namespace=namespace, track_name=track_name)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackStatus(MOQTMessage):
     namespace: bytes  # Tuple encoded
     track_name: bytes
@@ -146,8 +146,7 @@ class TrackStatus(MOQTMessage):
     last_group_id: int
     last_object_id: int
 
-    def __post_init__(self):
-        self.type = MessageTypes.TRACK_STATUS
+    type: ClassVar[int] = MessageTypes.TRACK_STATUS
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=32)
@@ -215,7 +214,7 @@ class TrackStatus(MOQTMessage):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscribe(MOQTMessage):
     """SUBSCRIBE message for requesting track data."""
     subscribe_id: int
@@ -230,8 +229,7 @@ class Subscribe(MOQTMessage):
     end_group: Optional[int] = None
     parameters: Optional[Dict[int, bytes]] = None
 
-    def __post_init__(self):
-        self.type = MessageTypes.SUBSCRIBE
+    type: ClassVar[int] = MessageTypes.SUBSCRIBE
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=64)
@@ -275,13 +273,12 @@ class Subscribe(MOQTMessage):
         return buf.data
 
 
-@dataclass
+@dataclass(slots=True)
 class Unsubscribe(MOQTMessage):
     """UNSUBSCRIBE message for ending track subscription."""
     subscribe_id: int
 
-    def __post_init__(self):
-        self.type = MessageTypes.UNSUBSCRIBE
+    type: ClassVar[int] = MessageTypes.UNSUBSCRIBE
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=8)
@@ -295,7 +292,7 @@ class Unsubscribe(MOQTMessage):
         return buf.data
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscribeDone(MOQTMessage):
     """SUBSCRIBE_DONE message indicating subscription completion."""
     subscribe_id: int
@@ -303,21 +300,21 @@ class SubscribeDone(MOQTMessage):
     stream_count: int
     reason: str
 
-    def __post_init__(self):
-        self.type = MessageTypes.SUBSCRIBE_DONE
+    type: ClassVar[int] = MessageTypes.SUBSCRIBE_DONE
 
     def serialize(self) -> bytes:
-        buf = Buffer(capacity=32)
-
         # Write message type and calculate payload size
-        payload_size = 0
-        payload_size += 1  # subscribe_id varint
-        payload_size += 1  # status_code varint
-        payload_size += 1  # stream_count varint
         reason_bytes = self.reason.encode()
-        payload_size += 1  # reason length varint
+        payload_size = 0
+        payload_size += varint_len(self.subscribe_id)
+        payload_size += varint_len(self.status_code)
+        payload_size += varint_len(self.stream_count)
+        payload_size += varint_len(len(reason_bytes))
         payload_size += len(reason_bytes)  # reason string
 
+        buf = Buffer(capacity=varint_len(self.type) +
+                     varint_len(payload_size) + payload_size)
+
         # Write header
         buf.push_uint_var(self.type)
         buf.push_uint_var(payload_size)
@@ -347,13 +344,12 @@ class SubscribeDone(MOQTMessage):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MaxSubscribeId(MOQTMessage):
     """MAX_SUBSCRIBE_ID message setting maximum subscribe ID."""
     subscribe_id: int
 
-    def __post_init__(self):
-        self.type = MessageTypes.MAX_SUBSCRIBE_ID
+    type: ClassVar[int] = MessageTypes.MAX_SUBSCRIBE_ID
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=16)
@@ -372,13 +368,12 @@ class MaxSubscribeId(MOQTMessage):
         return cls(subscribe_id=subscribe_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscribesBlocked(MOQTMessage):
     """SUBSCRIBES_BLOCKED message indicating subscriber is blocked."""
     maximum_subscribe_id: int
 
-    def __post_init__(self):
-        self.type = MessageTypes.SUBSCRIBES_BLOCKED
+    type: ClassVar[int] = MessageTypes.SUBSCRIBES_BLOCKED
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=16)
@@ -397,7 +392,7 @@ class SubscribesBlocked(MOQTMessage):
         return cls(maximum_subscribe_id=maximum_subscribe_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscribeOk(MOQTMessage):
     """SUBSCRIBE_OK message indicating successful subscription."""
     subscribe_id: int
@@ -408,8 +403,7 @@ class SubscribeOk(MOQTMessage):
     largest_object_id: Optional[int] = None  # Only if content_exists=1
     parameters: Optional[Dict[int, bytes]] = None
 
-    def __post_init__(self):
-        self.type = MessageTypes.SUBSCRIBE_OK
+    type: ClassVar[int] = MessageTypes.SUBSCRIBE_OK
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=64)
@@ -487,7 +481,7 @@ class SubscribeOk(MOQTMessage):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscribeError(MOQTMessage):
     """SUBSCRIBE_ERROR message indicating subscription failure."""
     subscribe_id: int
@@ -495,8 +489,7 @@ class SubscribeError(MOQTMessage):
     reason: str
     track_alias: int
 
-    def __post_init__(self):
-        self.type = MessageTypes.SUBSCRIBE_ERROR
+    type: ClassVar[int] = MessageTypes.SUBSCRIBE_ERROR
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=64)
@@ -539,7 +532,7 @@ class SubscribeError(MOQTMessage):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscribeUpdate(MOQTMessage):
     """SUBSCRIBE_UPDATE message for modifying an existing subscription."""
     subscribe_id: int
@@ -549,8 +542,7 @@ class SubscribeUpdate(MOQTMessage):
     priority: int
     parameters: Optional[Dict[int, bytes]] = None
 
-    def __post_init__(self):
-        self.type = MessageTypes.SUBSCRIBE_UPDATE
+    type: ClassVar[int] = MessageTypes.SUBSCRIBE_UPDATE
 
     def serialize(self) -> bytes:
         buf = Buffer(capacity=64)
@@ -13,12 +13,27 @@ from aioquic.h3.events import HeadersReceived, DataReceived, WebTransportStreamD
 from aioquic.quic.logger import QuicLoggerTrace
 
 from .utils.logger import get_logger
+from .utils.varint import decode_varint, varint_size
 from .messages import MessageHandler
 from .moqtypes import SessionCloseCode, StreamType, MessageTypes
 
 logger = get_logger(__name__)
 
 
+def _control_message_size(view: memoryview, offset: int, end: int) -> Optional[int]:
+    """Return size of the control message at offset, None if incomplete."""
+    type_len = varint_size(view[offset])
+    if offset + type_len >= end:
+        return None
+    header_len = type_len + varint_size(view[offset + type_len])
+    if offset + header_len > end:
+        return None
+    length = decode_varint(view, offset + type_len)
+    if offset + header_len + length > end:
+        return None
+    return header_len + length
+
+
 class H3CustomConnection(H3Connection):
     """Custom H3Connection wrapper to support alternate SETTINGS"""
 
@@ -75,7 +90,11 @@ class MOQTProtocol(QuicConnectionProtocol):
         self._streams: Dict[int, Dict] = {}
         self._groups = defaultdict(lambda: {'objects': 0, 'subgroups': set()})
         self._wt_session = asyncio.Event()
-        self._moqt_session = asyncio.Event()
+        # one-shot, resolved once MOQT setup completes: with the received
+        # SERVER_SETUP on the client, with None once sent on the server
+        self._moqt_session: asyncio.Future = self._loop.create_future()
+        # partial control message carried over between stream reads
+        self._control_buffer = bytearray()
 
         # Initialize message handling
         self.message_handler = MessageHandler(self)
@@ -109,7 +128,7 @@ class MOQTProtocol(QuicConnectionProtocol):
             if event.stream_id == self._control_stream_id:
                 logger.debug(
                     f"QUIC EVENT: control stream {event.stream_id}: data: 0x{event.data.hex()}")
-                self.message_handler.handle_message(event.data)
+                self._handle_control_data(event.data)
                 return
             elif event.stream_id in self._streams:
                 logger.debug(
@@ -179,6 +198,40 @@ class MOQTProtocol(QuicConnectionProtocol):
             logger.debug(
                 f"H3 EVENT: stream {event.stream_id}: data: 0x{event.data.hex()}")
 
+    def _handle_control_data(self, data: bytes) -> None:
+        """Reassemble control stream data and dispatch complete messages."""
+        if self._control_buffer:
+            self._control_buffer += data
+            data = bytes(self._control_buffer)
+            self._control_buffer.clear()
+
+        view = memoryview(data)
+        end = len(data)
+        offset = 0
+        while offset < end:
+            size = _control_message_size(view, offset, end)
+            if size is None:
+                break
+            start = offset
+            # advance first: a message that fails to parse must not leave
+            # the stream out of frame, the length prefix lets us skip it
+            offset += size
+            if start == 0 and size == end:
+                # common case: one whole message per read, no copy
+                message = data
+            else:
+                message = data[start:offset]
+            try:
+                self.message_handler.handle_message(message)
+            except Exception:
+                logger.warning(
+                    f"MOQT: control stream: skipped {size} byte message")
+
+        if offset < end:
+            logger.debug(
+                f"MOQT: control stream: buffering {end - offset} bytes of partial message")
+            self._control_buffer += view[offset:]
+
     def _handle_data_message(self, stream_id: int, data: bytes) -> None:
         """Process incoming data messages (not control messages)."""
         if not data:
@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from pathlib import Path
 
+from async_timeout import timeout
 from aioquic.asyncio.server import serve
 from aioquic.h3.connection import H3_ALPN
 from aioquic.quic.configuration import QuicConfiguration
@@ -36,7 +37,8 @@ class MOQTServer(MOQTProtocol):
         # WebTransport/H3 is already initialized by this point
         # Wait for CLIENT_SETUP
         try:
-            await asyncio.wait_for(self._wt_session.wait(), timeout=30.0)
+            async with timeout(30.0):
+                await self._wt_session.wait()
             logger.info("WebTransport session established")
         except asyncio.TimeoutError:
             logger.error("WebTransport session establishment timeout")
@@ -48,7 +50,7 @@ class MOQTServer(MOQTProtocol):
             self.message_builder.server_setup(version=0xff000007)
         )
 
-        self._moqt_session.set()
+        self._moqt_session.set_result(None)
         logger.info("MOQT session setup complete")
 
 
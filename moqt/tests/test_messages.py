@@ -0,0 +1,57 @@
+import pytest
+from aioquic.buffer import Buffer
+
+from moqt.messages import MessageHandler
+from moqt.messages.setup import ClientSetup, GoAway
+from moqt.messages.subscribe import SubscribeDone
+from moqt.moqtypes import SetupParamType
+
+
+def roundtrip(msg):
+    """Serialize msg, check its length prefix and parse it back."""
+    data = msg.serialize()
+    buffer = Buffer(data=data)
+    assert buffer.pull_uint_var() == msg.type
+    assert buffer.pull_uint_var() == len(data) - buffer.tell()
+    return MessageHandler(protocol=None).handle_message(data)
+
+
+@pytest.mark.parametrize("parameters", [
+    {},
+    {SetupParamType.ENDPOINT_PATH: b"/moq"},
+    {SetupParamType.ENDPOINT_PATH: b"/moq", 0x20: b"x" * 100},
+])
+def test_client_setup_roundtrip(parameters):
+    msg = ClientSetup(versions=[0xff000007, 0xff000008], parameters=parameters)
+    parsed = roundtrip(msg)
+    assert parsed == msg
+
+
+def test_client_setup_decodes_max_subscriber_id():
+    msg = ClientSetup(versions=[0xff000007], parameters={
+        SetupParamType.CLIENT_ROLE: b"\x03",
+        SetupParamType.MAX_SUBSCRIBER_ID: b"\x40\x10",
+    })
+    parsed = roundtrip(msg)
+    assert parsed.parameters == {
+        SetupParamType.CLIENT_ROLE: b"\x03",
+        SetupParamType.MAX_SUBSCRIBER_ID: 0x10,
+    }
+
+
+@pytest.mark.parametrize("uri", ["", "https://example.com/moq",
+                                 "https://example.com/" + "a" * 300])
+def test_goaway_roundtrip(uri):
+    msg = GoAway(new_session_uri=uri)
+    assert roundtrip(msg) == msg
+
+
+@pytest.mark.parametrize("subscribe_id, stream_count, reason", [
+    (1, 2, "done"),
+    (64, 16384, "subscription ended by publisher"),
+    (2**30, 2**40, "x" * 300),
+])
+def test_subscribe_done_roundtrip(subscribe_id, stream_count, reason):
+    msg = SubscribeDone(subscribe_id=subscribe_id, status_code=0x4,
+                        stream_count=stream_count, reason=reason)
+    assert roundtrip(msg) == msg
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from aioquic.quic.configuration import QuicConfiguration
+from aioquic.quic.connection import QuicConnection
+
+from moqt.protocol import MOQTProtocol
+from moqt.messages.setup import ClientSetup, GoAway, ServerSetup
+
+ANNOUNCE = b"\x06\x01\x00"  # no message class registered for 0x06
+
+
+@pytest.fixture
+def protocol():
+    async def create():
+        quic = QuicConnection(configuration=QuicConfiguration(is_client=True))
+        return MOQTProtocol(quic)
+
+    protocol = asyncio.run(create())
+    protocol.received = []
+    handle_message = protocol.message_handler.handle_message
+
+    def record(data):
+        protocol.received.append(handle_message(data))
+
+    protocol.message_handler.handle_message = record
+    return protocol
+
+
+def messages():
+    return [
+        ServerSetup(selected_version=0xff000007, parameters={0x20: b"x" * 100}),
+        GoAway(new_session_uri="https://example.com/" + "a" * 100),
+        ClientSetup(versions=[0xff000007], parameters={}),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_control_data_split_reads(protocol, chunk_size):
+    stream = b"".join(msg.serialize() for msg in messages())
+    for i in range(0, len(stream), chunk_size):
+        protocol._handle_control_data(stream[i:i + chunk_size])
+
+    assert protocol.received == messages()
+    assert protocol._control_buffer == b""
+
+
+def test_control_data_merged_read(protocol):
+    protocol._handle_control_data(
+        b"".join(msg.serialize() for msg in messages()))
+
+    assert protocol.received == messages()
+    assert protocol._control_buffer == b""
+
+
+def test_control_data_skips_bad_message(protocol):
+    server_setup = ServerSetup(selected_version=0xff000007, parameters={})
+    data = server_setup.serialize()
+
+    protocol._handle_control_data(ANNOUNCE + data[:2])
+    assert protocol.received == []
+    assert protocol._control_buffer == data[:2]
+
+    protocol._handle_control_data(data[2:])
+    assert protocol.received == [server_setup]
+    assert protocol._control_buffer == b""
@@ -26,13 +26,13 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """Get a logger with consistent formatting."""
     global _level, _handler
 
-    if name in _loggers:
-        logger = _loggers[name]
-    else:
+    logger = _loggers.get(name)
+    if logger is None:
         logger = logging.getLogger(name)
         _loggers[name] = logger
 
-    if not logger.handlers:  # Only add handler if none exists
+    new_logger = not logger.handlers
+    if new_logger:  # Only add handler if none exists
         if _handler is None:
             handler = logging.StreamHandler(sys.stderr)
             formatter = logging.Formatter(
@@ -49,7 +49,10 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     else:
         level = logging.INFO
     logger.setLevel(level)
-    logger.debug(f"setLevel: level:{getLevelName(level)} name: {name} ")
+    # only report the level once, when the logger is first configured
+    if new_logger and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("setLevel: level:%s name: %s",
+                     getLevelName(level), name)
 
     return logger
 
@@ -61,5 +64,8 @@ class QuicLoggerCustom(QuicLogger):
         # self.logger.debug(f"QUIC debug logger added")
 
     def log_event(self, event_type: str, data: dict) -> None:
-        self.logger.debug(f"QUIC: {event_type}")
-        self.logger.debug(json.dumps(data, indent=2))
+        # skip the json encoding entirely unless DEBUG will be emitted
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug("QUIC: %s", event_type)
+        self.logger.debug("%s", json.dumps(data, indent=2))
@@ -0,0 +1,32 @@
+import struct
+
+# value bit length -> encoded size of a QUIC variable-length integer
+VARINT_LENS = (1,) * 7 + (2,) * 8 + (4,) * 16 + (8,) * 32
+
+# varint length tag -> (decoder, value mask)
+_VARINT_DECODERS = (
+    (struct.Struct("!B"), 0x3F),
+    (struct.Struct("!H"), 0x3FFF),
+    (struct.Struct("!I"), 0x3FFFFFFF),
+    (struct.Struct("!Q"), 0x3FFFFFFFFFFFFFFF),
+)
+
+
+def varint_len(value: int) -> int:
+    """Return the encoded size of a QUIC variable-length integer."""
+    try:
+        return VARINT_LENS[value.bit_length()]
+    except IndexError:
+        raise ValueError(
+            "Integer is too big for a variable-length integer") from None
+
+
+def varint_size(first_byte: int) -> int:
+    """Return the encoded size of a varint from its first byte."""
+    return 1 << (first_byte >> 6)
+
+
+def decode_varint(data, offset: int = 0) -> int:
+    """Decode the QUIC variable-length integer at offset in data."""
+    decoder, mask = _VARINT_DECODERS[data[offset] >> 6]
+    return decoder.unpack_from(data, offset)[0] & mask